@@ -4,6 +4,8 @@ Global Configuration for Application
 import os
 import logging
 
+from sqlalchemy.pool import NullPool
+
 # Get configuration from environment
 DATABASE_URI = os.getenv(
     "DATABASE_URI",
@@ -13,7 +15,27 @@ DATABASE_URI = os.getenv(
 # Configure SQLAlchemy
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
-# SQLALCHEMY_POOL_SIZE = 2
+
+# Connection pool tuning: tests use NullPool so teardown has no pool state
+# to churn through; production gets a sized pool with pre-ping. Tests also
+# turn off synchronous_commit so the many small test transactions don't
+# each wait on a WAL fsync -- durability doesn't matter for a test database.
+if os.getenv("TESTING", "false").lower() == "true":
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "poolclass": NullPool,
+        "connect_args": {"options": "-c synchronous_commit=off"},
+    }
+    # These must be set before db.init_app() fixes the engine options;
+    # writing them into app.config afterwards has no effect
+    SQLALCHEMY_RECORD_QUERIES = False
+    SQLALCHEMY_ECHO = False
+else:
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
 
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "sup3r-s3cr3t")
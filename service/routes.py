@@ -22,7 +22,9 @@ This service implements a REST API that allows you to Create, Read, Update
 and Delete Wishlists and WishlistItems
 """
 
-from flask import request
+import json
+
+from flask import request, Response, stream_with_context
 from flask import current_app as app  # Import Flask application
 from flask_restx import Api, Resource, fields
 from service.wishlist import Wishlist, WishlistItem, DataValidationError
@@ -147,6 +149,33 @@ create_item_model = api.model(
 )
 
 
+# Typed filter parser built once at import time; coercion happens in one
+# declarative place instead of ad-hoc request.args lookups per handler.
+# ignore=True keeps the documented behavior of silently dropping
+# unparseable numeric filters rather than rejecting the request.
+item_filter_parser = (
+    api.parser()
+    .add_argument(
+        "product_name", type=str, location="args", help="Filter by product name"
+    )
+    .add_argument("category", type=str, location="args", help="Filter by category")
+    .add_argument(
+        "min_price",
+        type=float,
+        location="args",
+        ignore=True,
+        help="Filter by minimum price",
+    )
+    .add_argument(
+        "max_price",
+        type=float,
+        location="args",
+        ignore=True,
+        help="Filter by maximum price",
+    )
+)
+
+
 ######################################################################
 # Wishlist Collection Resource
 ######################################################################
@@ -247,8 +276,9 @@ class WishlistResource(Resource):
         """
         app.logger.info("Request for Wishlist with id: %s", wishlist_id)
 
-        # See if the wishlist exists and abort if it doesn't
-        wishlist = Wishlist.find(wishlist_id)
+        # Eager-load the items since serialize() walks them; find() would
+        # trigger a second lazy SELECT for the relationship
+        wishlist = Wishlist.find_with_items(wishlist_id)
         if not wishlist:
             api.abort(
                 status.HTTP_404_NOT_FOUND,
@@ -308,20 +338,7 @@ class WishlistItemCollection(Resource):
     """Handles all interactions with collections of WishlistItems"""
 
     @api.doc("list_wishlist_items")
-    @api.expect(
-        api.parser()
-        .add_argument(
-            "product_name", type=str, location="args", help="Filter by product name"
-        )
-        .add_argument("category", type=str, location="args", help="Filter by category")
-        .add_argument(
-            "min_price", type=float, location="args", help="Filter by minimum price"
-        )
-        .add_argument(
-            "max_price", type=float, location="args", help="Filter by maximum price"
-        )
-    )
-    @api.marshal_list_with(wishlist_item_model)
+    @api.expect(item_filter_parser)
     def get(self, wishlist_id):
         """
         List all items in a wishlist
@@ -339,22 +356,34 @@ class WishlistItemCollection(Resource):
                 f"Wishlist with id '{wishlist_id}' could not be found.",
             )
 
-        # Get query parameters
-        product_name = request.args.get("product_name")
-        category = request.args.get("category")
-        min_price = request.args.get("min_price", type=float)
-        max_price = request.args.get("max_price", type=float)
+        # Parse the typed query parameters declared on the shared parser
+        filters = item_filter_parser.parse_args()
 
-        # Apply filters using your existing logic
-        items = WishlistItem.find_with_filters(
+        # Stream the response so a large wishlist is never fully
+        # materialized in memory; rows arrive in yield_per batches
+        items = WishlistItem.stream_with_filters(
             wishlist_id=wishlist_id,
-            product_name=product_name,
-            category=category,
-            min_price=min_price,
-            max_price=max_price,
+            product_name=filters["product_name"],
+            category=filters["category"],
+            min_price=filters["min_price"],
+            max_price=filters["max_price"],
         )
 
-        return [item.serialize() for item in items], status.HTTP_200_OK
+        def generate():
+            yield "["
+            first = True
+            for item in items:
+                if not first:
+                    yield ","
+                first = False
+                yield json.dumps(api.marshal(item.serialize(), wishlist_item_model))
+            yield "]"
+
+        return Response(
+            stream_with_context(generate()),
+            status=status.HTTP_200_OK,
+            mimetype="application/json",
+        )
 
     @api.doc("create_wishlist_item")
     @api.expect(create_item_model)
@@ -386,6 +415,64 @@ class WishlistItemCollection(Resource):
         return item.serialize(), status.HTTP_201_CREATED
 
 
+######################################################################
+# Batch Wishlist Item Creation
+######################################################################
+@api.route("/wishlists/<int:wishlist_id>/items/batch")
+@api.param("wishlist_id", "The Wishlist identifier")
+class WishlistItemBatch(Resource):
+    """Creates a whole list of items in one request"""
+
+    @api.doc("create_wishlist_items_batch")
+    @api.expect([create_item_model])
+    @api.marshal_list_with(wishlist_item_model, code=201)
+    def post(self, wishlist_id):
+        """
+        Add a list of items to a wishlist
+        This endpoint accepts a JSON array and writes every item with a
+        single multi-row INSERT instead of one request per item
+        """
+        app.logger.info(
+            "Request to create a batch of items in Wishlist with id: %s", wishlist_id
+        )
+
+        # See if the wishlist exists and abort if it doesn't
+        wishlist = Wishlist.find(wishlist_id)
+        if not wishlist:
+            api.abort(
+                status.HTTP_404_NOT_FOUND,
+                f"Wishlist with id '{wishlist_id}' could not be found.",
+            )
+
+        payload = api.payload
+        if not isinstance(payload, list):
+            api.abort(
+                status.HTTP_400_BAD_REQUEST,
+                "Expected a JSON array of wishlist items",
+            )
+
+        # An empty array is a valid no-op; executing the batch INSERT
+        # with no rows would fail inside the database instead
+        if not payload:
+            app.logger.info("Empty batch for wishlist [%s]", wishlist_id)
+            return [], status.HTTP_201_CREATED
+
+        items = []
+        for data in payload:
+            if not isinstance(data, dict):
+                api.abort(
+                    status.HTTP_400_BAD_REQUEST,
+                    "Expected every element of the array to be a wishlist item object",
+                )
+            data["wishlist_id"] = wishlist_id  # Set the wishlist_id from the URL
+            items.append(WishlistItem().deserialize(data))
+
+        WishlistItem.create_batch(items)
+        app.logger.info("Created %d items in wishlist [%s]", len(items), wishlist_id)
+
+        return [item.serialize() for item in items], status.HTTP_201_CREATED
+
+
 ######################################################################
 # Individual Wishlist Item Resource
 ######################################################################
@@ -584,8 +671,8 @@ class LikeWishlistItem(Resource):
                 f"Item with id '{item_id}' could not be found in Wishlist with id '{wishlist_id}'.",
             )
 
-        item.likes = (item.likes or 0) + 1
-        item.update()
+        # Targeted UPDATE: only the likes column changes
+        item.patch(likes=(item.likes or 0) + 1)
 
         return {
             "message": f"Item {item_id} in wishlist {wishlist_id} liked.",
@@ -623,18 +710,9 @@ class CopyWishlist(Resource):
         new_wishlist.is_public = False  # Copies are private by default
         new_wishlist.create()
 
-        # Copy all items from the original wishlist
-        for original_item in original_wishlist.wishlist_items:
-            new_item = WishlistItem()
-            new_item.wishlist_id = new_wishlist.id
-            new_item.product_id = original_item.product_id
-            new_item.product_name = original_item.product_name
-            new_item.product_description = original_item.product_description
-            new_item.product_price = original_item.product_price
-            new_item.category = original_item.category
-            new_item.quantity = original_item.quantity
-            new_item.likes = 0  # Reset likes for copied items
-            new_item.create()
+        # Copy all items inside the database with one INSERT ... SELECT
+        # instead of loading each row into Python and re-inserting it
+        WishlistItem.copy_items(wishlist_id, new_wishlist.id)
 
         app.logger.info(
             "Wishlist %s copied to new wishlist %s", wishlist_id, new_wishlist.id
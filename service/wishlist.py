@@ -8,6 +8,9 @@ from datetime import datetime
 from decimal import Decimal
 import logging
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import bindparam, insert, literal, select, update as sql_update
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import selectinload
 
 logger = logging.getLogger("flask.app")
 
@@ -46,18 +49,35 @@ class Wishlist(db.Model):
     name = db.Column(db.String(255), nullable=False)
     description = db.Column(db.String(255))
     customer_id = db.Column(db.String(255), nullable=False)
-    # Timestamp for creation
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Timestamp for creation; the server default avoids a client-side
+    # default evaluation and value fetch on every insert
+    created_at = db.Column(
+        db.DateTime(timezone=True), server_default=db.func.now(), nullable=False
+    )
     # Timestamp for last update
     updated_at = db.Column(
-        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        db.DateTime(timezone=True),
+        server_default=db.func.now(),
+        onupdate=db.func.now(),
+        nullable=False,
     )
     is_public = db.Column(db.Boolean, default=False)
     wishlist_items = db.relationship(
-        "WishlistItem", backref="wishlist", lazy=True, cascade="all, delete-orphan"
+        "WishlistItem",
+        backref="wishlist",
+        lazy=True,
+        cascade="all, delete-orphan",
+        # Deterministic ordering: without it the list order depends on
+        # whichever plan Postgres picks for the relationship load
+        order_by="WishlistItem.id",
     )
 
     def __repr__(self):
+        # Keep this cheap: it runs on every logged create/update/delete
+        return f"<Wishlist id={self.id} customer_id={self.customer_id}>"
+
+    def debug_repr(self):
+        """Full string representation for debugging and troubleshooting"""
         created_at_str = self.created_at.isoformat() if self.created_at else "None"
         updated_at_str = self.updated_at.isoformat() if self.updated_at else "None"
 
@@ -196,47 +216,64 @@ class Wishlist(db.Model):
     @classmethod
     def all(cls):
         """Returns all of the records in the database"""
-        logger.info("Processing all records")
+        logger.debug("Processing all records")
         # pylint: disable=no-member
         return cls.query.all()
 
     @classmethod
     def find(cls, by_id):
         """Finds a record by it's ID"""
-        logger.info("Processing lookup for id %s ...", by_id)
+        logger.debug("Processing lookup for id %s ...", by_id)
         # pylint: disable=no-member
         return cls.query.session.get(cls, by_id)
 
+    @classmethod
+    def find_with_items(cls, by_id):
+        """Finds a record by its ID with the items eagerly loaded
+
+        Serialization touches wishlist_items, so call sites that go on
+        to serialize should use this instead of find() to avoid the
+        lazy-load SELECT firing after the initial lookup.
+        """
+        logger.debug("Processing eager lookup for id %s ...", by_id)
+        return db.session.scalars(
+            select(cls).options(selectinload(cls.wishlist_items)).where(cls.id == by_id)
+        ).first()
+
     @classmethod
     def find_by_name(cls, name):
         """Return all wishlists whose names contain the given term (case-insensitive)"""
-        logger.info(
+        logger.debug(
             "Processing partial, case-insensitive name query for '%s' ...", name
         )
-        return cls.query.filter(cls.name.ilike(f"%{name}%")).all()
+        return db.session.scalars(_WISHLIST_BY_NAME, {"pattern": f"%{name}%"}).all()
 
     @classmethod
     def find_for_user(cls, customer_id):
         """Return all wishlists for a specific user"""
-        logger.info("Processing lookup for user %s ...", customer_id)
-        return cls.query.filter(cls.customer_id == customer_id).all()
+        logger.debug("Processing lookup for user %s ...", customer_id)
+        return db.session.scalars(
+            _WISHLIST_FOR_USER, {"customer_id": customer_id}
+        ).all()
 
     @classmethod
     def find_by_visibility(cls, is_public):
         """Return all wishlists based on visibility"""
-        logger.info("Processing lookup for visibility %s ...", is_public)
-        return cls.query.filter(cls.is_public == is_public).all()
+        logger.debug("Processing lookup for visibility %s ...", is_public)
+        return db.session.scalars(
+            _WISHLIST_BY_VISIBILITY, {"is_public": is_public}
+        ).all()
 
     @classmethod
     def find_public_wishlists(cls):
         """Return all public wishlists"""
-        logger.info("Processing lookup for public wishlists ...")
+        logger.debug("Processing lookup for public wishlists ...")
         return cls.query.filter(cls.is_public.is_(True)).all()
 
     @classmethod
     def find_private_wishlists(cls):
         """Return all private wishlists"""
-        logger.info("Processing lookup for private wishlists ...")
+        logger.debug("Processing lookup for private wishlists ...")
         return cls.query.filter(cls.is_public.is_(False)).all()
 
 
@@ -250,7 +287,8 @@ class WishlistItem(db.Model):
     product_id = the id of the product
     product_name = the name of the product
     product_description = the description of the product
-    product_price = the price of the product
+    product_price_cents = the price of the product in integer cents
+        (exposed as a Decimal via the product_price hybrid property)
     category = the category of the product
     created_at = timestamp field to store when wishlist item was created
     updated_at = timestamp field to store when wishlist item was last updated
@@ -267,22 +305,59 @@ class WishlistItem(db.Model):
     product_id = db.Column(db.Integer, nullable=False)
     product_name = db.Column(db.String(255), nullable=False)
     product_description = db.Column(db.String(255), nullable=False)
-    product_price = db.Column(db.Numeric(precision=10, scale=2), nullable=False)
+    # Price is stored as integer cents; ints are far cheaper than Decimal for
+    # arithmetic, comparison, and JSON serialization on the request hot-path
+    product_price_cents = db.Column(db.Integer, nullable=False)
     category = db.Column(db.String(255), nullable=True)
-    created_at = db.Column(db.DateTime, default=db.func.now())
-    # updated_at = db.Column(db.DateTime, default=db.func.now())
+    created_at = db.Column(
+        db.DateTime(timezone=True), server_default=db.func.now(), nullable=False
+    )
     updated_at = db.Column(
-        db.DateTime, default=db.func.now(), onupdate=db.func.now(), nullable=False
+        db.DateTime(timezone=True),
+        server_default=db.func.now(),
+        onupdate=db.func.now(),
+        nullable=False,
     )
-    quantity = db.Column(db.Integer, nullable=False, default=1)
+    # SmallInteger is plenty for a per-wishlist quantity and halves the width
+    quantity = db.Column(db.SmallInteger, nullable=False, default=1)
     likes = db.Column(db.Integer, nullable=False, default=0)
-    # likes = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.CheckConstraint("quantity > 0", name="ck_wishlist_item_quantity_pos"),
+        # Composite indexes matching the filter endpoint's predicates, so
+        # price-range and category lookups within a wishlist are index
+        # range scans instead of sequential scans over all items
+        db.Index("ix_wishlist_item_wl_price", "wishlist_id", "product_price_cents"),
+        db.Index("ix_wishlist_item_wl_category", "wishlist_id", "category"),
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.likes = 0
 
+    @hybrid_property
+    def product_price(self):
+        """Expose the integer cents column as a Decimal price"""
+        if self.product_price_cents is None:
+            return None
+        return Decimal(self.product_price_cents) / 100
+
+    @product_price.setter
+    def product_price(self, value):
+        self.product_price_cents = int(Decimal(str(value)) * 100)
+
+    @product_price.expression
+    def product_price(cls):  # pylint: disable=no-self-argument
+        """SQL expression for the price in dollars used in class-level queries"""
+        # Divide as Numeric so Postgres does not truncate to integer division
+        return db.cast(cls.product_price_cents, db.Numeric(12, 2)) / 100
+
     def __repr__(self):
+        # Keep this cheap: it runs on every logged create/update/delete
+        return f"<WishlistItem id={self.id} wl={self.wishlist_id}>"
+
+    def debug_repr(self):
+        """Full string representation for debugging and troubleshooting"""
         return (
             f"<WishlistItem '{self.product_name}' "
             f"id=[{self.id}] "
@@ -327,7 +402,10 @@ class WishlistItem(db.Model):
             self.product_name = data["product_name"]
             self.product_description = data["product_description"]
             self.quantity = data.get("quantity", 1)
-            self.product_price = float(data["product_price"])
+            if "product_price_cents" in data:
+                self.product_price_cents = int(data["product_price_cents"])
+            else:
+                self.product_price = float(data["product_price"])
             self.category = data.get("category", None)
             self.created_at = data.get("created_at", None)
             self.updated_at = data.get("updated_at", None)
@@ -356,6 +434,14 @@ class WishlistItem(db.Model):
             ) from error
         return self
 
+    def _insert_params(self) -> dict:
+        """Column values for the Core insert path; unset columns fall back to their defaults"""
+        return {
+            column.name: getattr(self, column.name)
+            for column in self.__table__.columns
+            if column.name != "id" and getattr(self, column.name) is not None
+        }
+
     def create(self) -> None:
         """
         Creates a Account to the database
@@ -364,13 +450,58 @@ class WishlistItem(db.Model):
         # id must be none to generate next primary key
         self.id = None
         try:
-            db.session.add(self)
-            db.session.commit()
+            if self.wishlist is not None:
+                # The unit-of-work must cascade the wishlist relationship
+                db.session.add(self)
+                db.session.commit()
+            else:
+                # Hot path: a precompiled Core INSERT ... RETURNING skips the
+                # ORM flush machinery for the common single-row POST
+                row = db.session.execute(_ITEM_INSERT, self._insert_params()).first()
+                self.id = row.id
+                self.created_at = row.created_at
+                self.updated_at = row.updated_at
+                db.session.commit()
         except Exception as e:
             db.session.rollback()
             logger.error("Error creating record: %s", self)
             raise DataValidationError(e) from e
 
+    @classmethod
+    def create_batch(cls, items) -> None:
+        """
+        Creates many WishlistItems with one multi-row INSERT
+
+        The whole batch is written and committed in a single statement,
+        so creating N items costs one database round-trip instead of N.
+        :param items: a list of WishlistItem instances to persist
+        """
+        logger.info("Creating batch of %d items", len(items))
+        params = [
+            {
+                "wishlist_id": item.wishlist_id,
+                "product_id": item.product_id,
+                "product_name": item.product_name,
+                "product_description": item.product_description,
+                "product_price_cents": item.product_price_cents,
+                "category": item.category,
+                "quantity": item.quantity,
+                "likes": item.likes or 0,
+            }
+            for item in items
+        ]
+        try:
+            rows = db.session.execute(_ITEM_BATCH_INSERT, params).all()
+            for item, row in zip(items, rows):
+                item.id = row.id
+                item.created_at = row.created_at
+                item.updated_at = row.updated_at
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error creating batch of records: %s", e)
+            raise DataValidationError(e) from e
+
     def update(self) -> None:
         """
         Updates a Account to the database
@@ -385,6 +516,28 @@ class WishlistItem(db.Model):
             logger.error("Error updating record: %s", self)
             raise DataValidationError(e) from e
 
+    def patch(self, **fields) -> None:
+        """
+        Applies a targeted UPDATE for a subset of columns
+
+        Cheaper than update() when only a field or two change, since it
+        skips the full unit-of-work flush and sends just those columns.
+        """
+        logger.info("Patching %s", self)
+        if not self.id:
+            raise DataValidationError("Patch called with empty ID field")
+        try:
+            db.session.execute(
+                sql_update(WishlistItem)
+                .where(WishlistItem.id == self.id)
+                .values(updated_at=db.func.now(), **fields)
+            )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error patching record: %s", self)
+            raise DataValidationError(e) from e
+
     def delete(self) -> None:
         """Removes a Account from the data store"""
         logger.info("Deleting %s", self)
@@ -396,10 +549,95 @@ class WishlistItem(db.Model):
             logger.error("Error deleting record: %s", self)
             raise DataValidationError(e) from e
 
+    @classmethod
+    def copy_items(cls, source_wishlist_id, target_wishlist_id) -> None:
+        """Copies every item of one wishlist to another with INSERT ... SELECT
+
+        The whole copy happens inside Postgres in a single statement, so
+        no item rows ever travel to Python and back regardless of size.
+        """
+        logger.info(
+            "Copying items from wishlist %s to %s",
+            source_wishlist_id,
+            target_wishlist_id,
+        )
+        selectable = select(
+            literal(target_wishlist_id),
+            cls.product_id,
+            cls.product_name,
+            cls.product_description,
+            cls.product_price_cents,
+            cls.category,
+            cls.quantity,
+            literal(0),  # Copies start with zero likes
+        ).where(cls.wishlist_id == source_wishlist_id)
+        try:
+            db.session.execute(
+                insert(cls).from_select(
+                    [
+                        "wishlist_id",
+                        "product_id",
+                        "product_name",
+                        "product_description",
+                        "product_price_cents",
+                        "category",
+                        "quantity",
+                        "likes",
+                    ],
+                    selectable,
+                )
+            )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error copying records: %s", e)
+            raise DataValidationError(e) from e
+
+    @classmethod
+    def copy_load(cls, rows):
+        """Bulk-loads WishlistItems using Postgres COPY FROM STDIN
+
+        Streams the rows through the raw psycopg connection, which is much
+        faster than executemany INSERTs for very large seed loads.
+        :param rows: an iterable of WishlistItem instances to load
+        """
+        logger.info("Bulk loading wishlist items with COPY ...")
+        try:
+            raw_connection = db.session.connection().connection
+            with raw_connection.cursor().copy(
+                "COPY wishlist_item "
+                "(wishlist_id, product_id, product_name, product_description, "
+                "product_price_cents, category, quantity, likes, "
+                "created_at, updated_at) FROM STDIN"
+            ) as copy:
+                # COPY bypasses the Python-side column defaults so the
+                # timestamps must be supplied explicitly
+                now = datetime.utcnow()
+                for row in rows:
+                    copy.write_row(
+                        (
+                            row.wishlist_id,
+                            row.product_id,
+                            row.product_name,
+                            row.product_description,
+                            row.product_price_cents,
+                            row.category,
+                            row.quantity,
+                            row.likes,
+                            row.created_at or now,
+                            row.updated_at or now,
+                        )
+                    )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error bulk loading records: %s", e)
+            raise DataValidationError(e) from e
+
     @classmethod
     def find_by_product_name(cls, product_name, wishlist_id):
         """Return all items matching product_name"""
-        logger.info("Processing lookup for item %s ...", product_name)
+        logger.debug("Processing lookup for item %s ...", product_name)
         return cls.query.filter(
             cls.wishlist_id == wishlist_id, cls.product_name == product_name
         ).all()
@@ -407,7 +645,7 @@ class WishlistItem(db.Model):
     @classmethod
     def find_by_category(cls, category, wishlist_id):
         """Return all items matching category in a specific wishlist"""
-        logger.info(
+        logger.debug(
             "Processing lookup for category %s in wishlist %s...", category, wishlist_id
         )
         return cls.query.filter(
@@ -417,7 +655,7 @@ class WishlistItem(db.Model):
     @classmethod
     def find_by_price_range(cls, min_price, max_price, wishlist_id):
         """Return all items within a price range in a specific wishlist"""
-        logger.info(
+        logger.debug(
             "Processing lookup for price range %s-%s in wishlist %s...",
             min_price,
             max_price,
@@ -425,26 +663,27 @@ class WishlistItem(db.Model):
         )
         query = cls.query.filter(cls.wishlist_id == wishlist_id)
 
+        # Compare against the raw cents column so the composite
+        # (wishlist_id, product_price_cents) index can serve the range
         if min_price is not None:
-            min_price = Decimal(str(min_price))
-            query = query.filter(cls.product_price >= min_price)
+            query = query.filter(
+                cls.product_price_cents >= int(Decimal(str(min_price)) * 100)
+            )
         if max_price is not None:
-            max_price = Decimal(str(max_price))
-            query = query.filter(cls.product_price <= max_price)
+            query = query.filter(
+                cls.product_price_cents <= int(Decimal(str(max_price)) * 100)
+            )
 
         return query.all()
 
     @classmethod
-    def find_with_filters(cls, **filters):
-        """
-        Find items with multiple filters applied
-        This is the most flexible method that combines all possible filters
-        """
+    def _filter_query(cls, **filters):
+        """Builds the filtered query shared by the find/stream variants"""
         wishlist_id = filters.get("wishlist_id")
         if not wishlist_id:
             raise ValueError("wishlist_id is required")
 
-        logger.info("Processing lookup with filters in wishlist %s...", wishlist_id)
+        logger.debug("Processing lookup with filters in wishlist %s...", wishlist_id)
         query = cls.query.filter(cls.wishlist_id == wishlist_id)
 
         product_name = filters.get("product_name")
@@ -456,23 +695,72 @@ class WishlistItem(db.Model):
             query = query.filter(cls.product_name == product_name)
         if category:
             query = query.filter(cls.category == category)
+        # Compare against the raw cents column so the composite
+        # (wishlist_id, product_price_cents) index can serve the range
         if min_price is not None:
-            query = query.filter(cls.product_price >= min_price)
+            query = query.filter(
+                cls.product_price_cents >= int(Decimal(str(min_price)) * 100)
+            )
         if max_price is not None:
-            query = query.filter(cls.product_price <= max_price)
+            query = query.filter(
+                cls.product_price_cents <= int(Decimal(str(max_price)) * 100)
+            )
 
-        return query.all()
+        return query
+
+    @classmethod
+    def find_with_filters(cls, **filters):
+        """
+        Find items with multiple filters applied
+        This is the most flexible method that combines all possible filters
+        """
+        return cls._filter_query(**filters).all()
+
+    @classmethod
+    def stream_with_filters(cls, **filters):
+        """
+        Like find_with_filters, but yields rows in server-side batches so a
+        large wishlist never has to be materialized in memory at once
+        """
+        return cls._filter_query(**filters).yield_per(500)
 
     @classmethod
     def all(cls):
         """Returns all of the records in the database"""
-        logger.info("Processing all records")
+        logger.debug("Processing all records")
         # pylint: disable=no-member
         return cls.query.all()
 
     @classmethod
     def find(cls, by_id):
         """Finds a record by it's ID"""
-        logger.info("Processing lookup for id %s ...", by_id)
+        logger.debug("Processing lookup for id %s ...", by_id)
         # pylint: disable=no-member
         return cls.query.session.get(cls, by_id)
+
+
+# Compiled once at import time so the hot create path can reuse it
+# Lookup statements built once; bound parameters keep every invocation
+# on a single compiled-cache entry regardless of the search value
+_WISHLIST_BY_VISIBILITY = select(Wishlist).where(
+    Wishlist.is_public == bindparam("is_public")
+)
+
+_WISHLIST_BY_NAME = select(Wishlist).where(Wishlist.name.ilike(bindparam("pattern")))
+
+_WISHLIST_FOR_USER = select(Wishlist).where(
+    Wishlist.customer_id == bindparam("customer_id")
+)
+
+_ITEM_INSERT = insert(WishlistItem).returning(
+    WishlistItem.id, WishlistItem.created_at, WishlistItem.updated_at
+)
+
+# Batch variant: sort_by_parameter_order guarantees the RETURNING rows
+# come back in the same order the parameter dicts were supplied
+_ITEM_BATCH_INSERT = insert(WishlistItem).returning(
+    WishlistItem.id,
+    WishlistItem.created_at,
+    WishlistItem.updated_at,
+    sort_by_parameter_order=True,
+)
@@ -6,23 +6,31 @@ from datetime import datetime, timezone
 from decimal import Decimal
 import factory
 from factory.fuzzy import FuzzyChoice, FuzzyDateTime, FuzzyInteger
-from service.wishlist import Wishlist, WishlistItem
+from service.wishlist import Wishlist, WishlistItem, db
 
+# Shared fuzzer for timestamp fields; one instance is enough for every factory
+EPOCH_FUZZ = FuzzyDateTime(datetime(2000, 1, 1, tzinfo=timezone.utc))
 
-class WishlistFactory(factory.Factory):
+
+class WishlistFactory(factory.alchemy.SQLAlchemyModelFactory):
     """Loading fake wishlists"""
 
     class Meta:  # pylint: disable=too-few-public-methods
         """Maps factory to data model"""
 
         model = Wishlist
+        sqlalchemy_session = db.session
+        # One flush per create_batch instead of a commit per row; the
+        # default strategy stays build so Factory() has no DB side effects
+        sqlalchemy_session_persistence = "flush"
+        strategy = factory.BUILD_STRATEGY
 
     id = factory.Sequence(lambda n: n)
     name = factory.Faker("word")
     description = factory.Faker("sentence")
     customer_id = factory.Faker("word")
-    created_at = FuzzyDateTime(datetime(2000, 1, 1, tzinfo=timezone.utc))
-    updated_at = FuzzyDateTime(datetime(2000, 1, 1, tzinfo=timezone.utc))
+    created_at = EPOCH_FUZZ
+    updated_at = EPOCH_FUZZ
     is_public = FuzzyChoice(choices=[True, False])
 
     @factory.post_generation
@@ -37,7 +45,7 @@ class WishlistFactory(factory.Factory):
             self.wishlist_items = extracted
 
 
-class WishlistItemFactory(factory.Factory):
+class WishlistItemFactory(factory.alchemy.SQLAlchemyModelFactory):
     """Loading fake wishlist items from factory"""
 
     # pylint: disable=too-few-public-methods
@@ -45,6 +53,9 @@ class WishlistItemFactory(factory.Factory):
         """Maps"""
 
         model = WishlistItem
+        sqlalchemy_session = db.session
+        sqlalchemy_session_persistence = "flush"
+        strategy = factory.BUILD_STRATEGY
 
     id = factory.Sequence(lambda n: n)
     wishlist_id = factory.Faker("random_int", min=1, max=9999)
@@ -62,6 +73,6 @@ class WishlistItemFactory(factory.Factory):
         max_value=Decimal("1000.00"),
     )
     category = FuzzyChoice(choices=["electronics", "food", "clothing", "books", "toys", "home", None])
-    created_at = FuzzyDateTime(datetime(2000, 1, 1, tzinfo=timezone.utc))
-    updated_at = FuzzyDateTime(datetime(2000, 1, 1, tzinfo=timezone.utc))
+    created_at = EPOCH_FUZZ
+    updated_at = EPOCH_FUZZ
     wishlist = factory.SubFactory(WishlistFactory)